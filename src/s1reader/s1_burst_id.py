@@ -138,7 +138,11 @@ class S1BurstId:
         # e.g., you can filter down burst IDs with:
         # burst_ids = ["t012_024518_iw3", "t012_024519_iw3"]
         # bursts = [b for b in bursts if b.burst_id in burst_ids]
-        if isinstance(other, str):
-            return str(self) == other
+        if isinstance(other, (str, S1BurstId)):
+            return str(self) == str(other)
         else:
-            return super().__eq__(other)
+            return NotImplemented
+
+    def __hash__(self):
+        # Consistent with `__eq__`, so equal IDs match in sets and dict keys
+        return hash(str(self))
@@ -1,6 +1,7 @@
 import os
 from dataclasses import dataclass
 import datetime
+from functools import lru_cache
 import tempfile
 from typing import Optional
 import warnings
@@ -139,21 +140,20 @@ def _evaluate_polynomial_array(arr_polynomial, grid_tau, vec_tau0):
         Evaluated values on the correction grid
     """
 
-    ncol = grid_tau.shape[1]
-    term_tau = grid_tau - vec_tau0 * np.ones(ncol)[np.newaxis, ...]
+    # `vec_tau0` and the coefficients broadcast along range (columns),
+    # so no full-grid copies of them need to be allocated
+    term_tau = grid_tau - vec_tau0
+    coeff_0, coeff_1, coeff_2 = [
+        arr_polynomial[:, i][..., np.newaxis] for i in range(3)
+    ]
 
-    eval_out = (
-        arr_polynomial[:, 0][..., np.newaxis] * np.ones(ncol)[np.newaxis, ...]
-        + (arr_polynomial[:, 1][..., np.newaxis] * np.ones(ncol)[np.newaxis, ...])
-        * term_tau
-        + (arr_polynomial[:, 2][..., np.newaxis] * np.ones(ncol)[np.newaxis, ...])
-        * term_tau**2
-    )
+    # Horner's scheme: one multiply-add per order, no explicit power
+    eval_out = coeff_0 + term_tau * (coeff_1 + term_tau * coeff_2)
 
     return eval_out
 
 
-def _llh_to_ecef(lat, lon, hgt, ellipsoid, in_degree=True):
+def llh_to_ecef(lat, lon, hgt, ellipsoid, in_degree=True):
     """
     Calculate cartesian coordinates in ECEF from
     latitude, longitude, and altitude
@@ -190,17 +190,51 @@ def _llh_to_ecef(lat, lon, hgt, ellipsoid, in_degree=True):
         rad_lat = lat
         rad_lon = lon
 
-    v_ellipsoid = ellipsoid.a / np.sqrt(
-        1 - ellipsoid.e2 * np.sin(rad_lat) * np.sin(rad_lat)
-    )
+    # evaluate each trig function once; they dominate the cost on large grids
+    sin_lat = np.sin(rad_lat)
+    cos_lat = np.cos(rad_lat)
 
-    x_ecef = (v_ellipsoid + hgt) * np.cos(rad_lat) * np.cos(rad_lon)
-    y_ecef = (v_ellipsoid + hgt) * np.cos(rad_lat) * np.sin(rad_lon)
-    z_ecef = (v_ellipsoid * (1 - ellipsoid.e2) + hgt) * np.sin(rad_lat)
+    v_ellipsoid = ellipsoid.a / np.sqrt(1 - ellipsoid.e2 * sin_lat * sin_lat)
+
+    x_ecef = (v_ellipsoid + hgt) * cos_lat * np.cos(rad_lon)
+    y_ecef = (v_ellipsoid + hgt) * cos_lat * np.sin(rad_lon)
+    z_ecef = (v_ellipsoid * (1 - ellipsoid.e2) + hgt) * sin_lat
 
     return (x_ecef, y_ecef, z_ecef)
 
 
+def _get_raster_size(raster_path: str):
+    """
+    Get the size of a raster, opening each file only once.
+    All bursts of a subswath share the same measurement tiff, so writing
+    every burst to a VRT would otherwise reopen (and, for a zipped SAFE,
+    re-seek into) the same file once per burst.
+    The cache is keyed on the file's modification time and size, so a
+    replaced file at the same path is opened again.
+
+    Parameters:
+    -----------
+    raster_path: str
+        Path to the raster (may be a GDAL virtual path, e.g. /vsizip/)
+
+    Return:
+    -------
+    _: tuple
+        Width and length of the raster in pixels
+    """
+    stat = gdal.VSIStatL(raster_path)
+    if stat is None:
+        raise FileNotFoundError(f"{raster_path} not found")
+    return _read_raster_size(raster_path, stat.mtime, stat.size)
+
+
+@lru_cache(maxsize=32)
+def _read_raster_size(raster_path: str, mtime: int, size: int):
+    """Open `raster_path` and read its size (cached by `_get_raster_size`)."""
+    gdal_obj = gdal.Open(raster_path, gdal.GA_ReadOnly)
+    return gdal_obj.RasterXSize, gdal_obj.RasterYSize
+
+
 @dataclass
 class AzimuthCarrierComponents:
     kt: np.ndarray
@@ -413,9 +447,7 @@ class Sentinel1BurstSlc:
         yoffset = line_offset + self.first_valid_line
         localyoffset = self.first_valid_line
         xoffset = self.first_valid_sample
-        gdal_obj = gdal.Open(self.tiff_path, gdal.GA_ReadOnly)
-        fullwidth = gdal_obj.RasterXSize
-        fulllength = gdal_obj.RasterYSize
+        fullwidth, fulllength = _get_raster_size(self.tiff_path)
 
         # TODO maybe cleaner to write with ElementTree
         tmpl = f"""<VRTDataset rasterXSize="{outwidth}" rasterYSize="{outlength}">
@@ -653,13 +685,18 @@ class Sentinel1BurstSlc:
            get the corrected azimuth times.
         """
         range_vec, az_vec = self._steps_to_vecs(range_step, az_step)
+        total_doppler = self._total_doppler(range_vec, az_vec)
 
+        return isce3.core.LUT2d(range_vec, az_vec, total_doppler)
+
+    def _total_doppler(self, range_vec, az_vec):
+        """Evaluate the geometrical + steering Doppler on the given range/az vectors."""
         # convert from meters to pixels
         x_vec = (range_vec - self.starting_range) / self.range_pixel_spacing
 
-        # convert from seconds to pixels
-        rdrgrid = self.as_isce3_radargrid()
-        y_vec = (az_vec - rdrgrid.sensing_start) / self.azimuth_time_interval
+        # convert from seconds to pixels; the decimated grid from `_steps_to_vecs`
+        # keeps the full resolution sensing start, so no second grid is needed
+        y_vec = (az_vec - az_vec[0]) / self.azimuth_time_interval
 
         # compute az carrier components with pixels
         x_mesh, y_mesh = np.meshgrid(x_vec, y_vec)
@@ -667,9 +704,7 @@ class Sentinel1BurstSlc:
 
         geometrical_doppler = self.doppler.poly1d.eval(range_vec)
 
-        total_doppler = az_carr_comp.antenna_steering_doppler + geometrical_doppler
-
-        return isce3.core.LUT2d(range_vec, az_vec, total_doppler)
+        return az_carr_comp.antenna_steering_doppler + geometrical_doppler
 
     def doppler_induced_range_shift(self, range_step=500, az_step=50):
         """
@@ -692,10 +727,8 @@ class Sentinel1BurstSlc:
         """
         range_vec, az_vec = self._steps_to_vecs(range_step, az_step)
 
-        doppler_shift = self.geometrical_and_steering_doppler(
-            range_step=range_step, az_step=az_step
-        )
-        tau_corr = doppler_shift.data / self.range_chirp_rate
+        doppler_shift = self._total_doppler(range_vec, az_vec)
+        tau_corr = doppler_shift / self.range_chirp_rate
 
         return isce3.core.LUT2d(range_vec, az_vec, tau_corr)
 
@@ -983,8 +1016,8 @@ class Sentinel1BurstSlc:
         )
         tau0_fdc_interp = interpolator_tau0_fdc_interp(vec_t)[..., np.newaxis]
 
-        # add range time origin to vec_tau
-        grid_tau += tau0_ka_interp * np.ones(vec_tau.shape)[np.newaxis, ...]
+        # add range time origin to vec_tau; the column broadcasts along range
+        grid_tau += tau0_ka_interp
 
         # Interpolate the DC and fm rate coeffs along azimuth time
         def interp_coeffs(az_time, coeffs, az_time_interp):
@@ -1014,10 +1047,8 @@ class Sentinel1BurstSlc:
             * self.azimuth_steer_rate
         )
 
-        kappa_steer_grid = (
-            kappa_steer_vec[..., np.newaxis]
-            * np.ones(grid_tau.shape[1])[np.newaxis, ...]
-        )
+        # (n_az, 1) column, which broadcasts along range over the grid
+        kappa_steer_grid = kappa_steer_vec[..., np.newaxis]
 
         t_burst = (grid_t[0, 0] + grid_t[-1, 0]) / 2.0
         index_mid_burst_t = int(grid_t.shape[0] / 2 + 0.5)
@@ -1059,19 +1090,14 @@ class Sentinel1BurstSlc:
             )
         )
 
-        x_ecef, y_ecef, z_ecef = _llh_to_ecef(lat_map, lon_map, hgt_map, ellipsoid)
+        x_ecef, y_ecef, z_ecef = llh_to_ecef(lat_map, lon_map, hgt_map, ellipsoid)
 
-        # Populate the position, velocity, and
-        # acceleration of the satellite to the correction grid
-        tau_ones = np.ones(grid_tau.shape[1])[np.newaxis, ...]
-        x_s, y_s, z_s = [
-            vec_position_intp[:, i][..., np.newaxis] * tau_ones for i in range(3)
-        ]
-        vx_s, vy_s, vz_s = [
-            vec_vel_intp[:, i][..., np.newaxis] * tau_ones for i in range(3)
-        ]
+        # Position, velocity, and acceleration of the satellite as columns,
+        # which broadcast along range over the correction grid
+        x_s, y_s, z_s = [vec_position_intp[:, i][..., np.newaxis] for i in range(3)]
+        vx_s, vy_s, vz_s = [vec_vel_intp[:, i][..., np.newaxis] for i in range(3)]
         ax_s, ay_s, az_s = [
-            vec_acceleration_intp[:, i][..., np.newaxis] * tau_ones for i in range(3)
+            vec_acceleration_intp[:, i][..., np.newaxis] for i in range(3)
         ]
 
         mag_xs_xg = np.sqrt(
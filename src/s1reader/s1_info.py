@@ -6,13 +6,15 @@ import argparse
 import sys
 import warnings
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from itertools import chain
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 
 import lxml.etree as ET
-import shapely.geometry
-import shapely.ops
+import numpy as np
+import shapely
 
 import s1reader
 
@@ -130,12 +132,34 @@ def _bounds_from_bursts(safe_path: Union[Path, str]) -> list[float]:
     if bursts is None:
         raise ValueError("Could not load any polarizations in {safe_path}.")
 
-    # Convert the border (list of polygons) into a MultiPolygon
-    all_borders = [shapely.geometry.MultiPolygon(b.border) for b in bursts]
-    # Perform a union to get one shape for the entire frame
-    border_geom = shapely.ops.unary_union(all_borders)
-    # grab the bounds and pad as needed
-    return list(border_geom.bounds)
+    # Flatten the borders (lists of polygons) into one array, so the bounds of
+    # the entire frame come from a single vectorized call (no union needed)
+    all_borders = np.array([poly for b in bursts for poly in b.border], dtype=object)
+    return shapely.total_bounds(all_borders).tolist()
+
+
+def get_burst_bounds(bursts: list[s1reader.Sentinel1BurstSlc]) -> np.ndarray:
+    """Get the bounding box of each burst in `bursts`.
+
+    bounding box format is [lonmin, latmin, lonmax, latmax]
+
+    Parameters
+    ----------
+    bursts : list[Sentinel1BurstSlc]
+        Bursts to get the bounds of.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (len(bursts), 4), one bounding box per row.
+    """
+    if len(bursts) == 0:
+        return np.empty((0, 4))
+    # Build all the burst MultiPolygons in one call, grouping each burst's
+    # border polygons by their index into `bursts`
+    parts = [poly for b in bursts for poly in b.border]
+    indices = np.repeat(np.arange(len(bursts)), [len(b.border) for b in bursts])
+    return shapely.bounds(shapely.multipolygons(parts, indices=indices))
 
 
 EXAMPLE = """
@@ -156,6 +180,9 @@ Example usage:
     # Print only from subswath IW1, and "vv" polarization
     s1_info -b S1A_IW_SLC__1SDV_2018* --iw 1 --pol vv
 
+    # Read 8 products at a time
+    s1_info -b S1A_IW_SLC__1SDV_2018* --jobs 8
+
     # Get info for all products in the 'data/' directory
     s1_info data/
 
@@ -175,6 +202,30 @@ Example usage:
 """
 
 
+def _iter_product_info(path: Path, args: argparse.Namespace) -> Iterator[str]:
+    """Yield the lines printed by `s1_info` for one Sentinel-1 product."""
+    if args.frame_bbox:
+        yield f"{path}: {get_frame_bounds(path)}"
+        return
+
+    yield f"Bursts in {path}:"
+    yield "-" * 80
+    bursts = get_bursts(path, args.pol, args.iw)
+    if args.burst_bbox:
+        burst_bounds = get_burst_bounds(bursts)
+    # Do we want to pretty-print this with rich?
+    for i, burst in enumerate(bursts):
+        line = f"{burst.burst_id if args.burst_id else burst} "
+        if args.burst_bbox:
+            line += f"{burst_bounds[i].tolist()} "
+        yield line
+
+
+def _get_product_info(path: Path, args: argparse.Namespace) -> list[str]:
+    """Get all the `s1_info` lines for one product (to return from a worker)."""
+    return list(_iter_product_info(path, args))
+
+
 def get_cli_args():
     parser = argparse.ArgumentParser(
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -233,6 +284,13 @@ def get_cli_args():
             " with files named for each S1 product (default= %(default)s)."
         ),
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of products to read in parallel (default= %(default)s).",
+    )
     return parser.parse_args()
 
 
@@ -251,27 +309,25 @@ def main():
             warnings.warn(f"{path} is not a file or directory. Skipping.")
 
     print(f"Found {len(all_files)} Sentinel-1 SLC products.", file=sys.stderr)
+    if args.jobs > 1:
+        # Each product is parsed independently, so spread them over processes
+        # (the XML parsing holds the GIL). `map` keeps the output in order.
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            if args.plot:
+                list(executor.map(_plot_bursts, all_files))
+                return
+            get_info = partial(_get_product_info, args=args)
+            for lines in executor.map(get_info, all_files):
+                for line in lines:
+                    print(line)
+        return
+
     for path in all_files:
         if args.plot:
             _plot_bursts(path)
             continue
-        elif args.frame_bbox:
-            msg = f"{path}: {get_frame_bounds(path)}"
-            print(msg)
-            continue
-
-        print(f"Bursts in {path}:")
-        print("-" * 80)
-        # Do we want to pretty-print this with rich?
-        for burst in get_bursts(path, args.pol, args.iw):
-            if args.burst_id:
-                print(burst.burst_id, end=" ")
-            else:
-                print(burst, end=" ")
-
-            if args.burst_bbox:
-                print(list(shapely.geometry.MultiPolygon(burst.border).bounds), end=" ")
-            print()
+        for line in _iter_product_info(path, args):
+            print(line)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import bisect
 import datetime
 import glob
 import os
 import warnings
 import lxml.etree as ET
 import zipfile
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Union
 
 from types import SimpleNamespace
@@ -33,7 +36,7 @@ from s1reader.s1_annotation import (
     SwathMiscMetadata,
 )
 
-from s1reader.s1_burst_slc import Doppler, Sentinel1BurstSlc
+from s1reader.s1_burst_slc import Doppler, Sentinel1BurstSlc, llh_to_ecef
 from s1reader.s1_burst_id import S1BurstId
 from s1reader.s1_orbit import T_ORBIT, PADDING_SHORT, merge_osv_list
 
@@ -168,7 +171,86 @@ def doppler_poly1d_to_lut2d(
     return isce3.core.LUT2d(slant_ranges, az_times, np.vstack((freq_1d, freq_1d)))
 
 
-def get_burst_orbit(sensing_start, sensing_stop, osv_list: ET.Element):
+@dataclass(frozen=True)
+class OrbitStateVectors:
+    """Orbit state vectors, parsed from the XML into arrays."""
+
+    times: tuple  # datetime.datetime of each state vector, sorted
+    position: np.ndarray  # (N, 3) ECEF positions [m]
+    velocity: np.ndarray  # (N, 3) ECEF velocities [m/s]
+
+
+def parse_osv_list(osv_list: ET.Element) -> OrbitStateVectors:
+    """Parse orbit state vectors into arrays of times, positions and velocities.
+
+    Parameters:
+    -----------
+    osv_list : xml.etree.ElementTree.Element
+        ElementTree containing orbit state vectors
+
+    Returns:
+    --------
+    _ : OrbitStateVectors
+        Times, positions and velocities of the orbit state vectors.
+    """
+    times = tuple(as_datetime(osv[1].text[4:]) for osv in osv_list)
+    state = np.array(
+        [[float(osv[i].text) for i in range(4, 10)] for osv in osv_list]
+    ).reshape(-1, 6)
+    # read-only, so that a cached result can be shared between callers
+    state.setflags(write=False)
+    return OrbitStateVectors(times, state[:, :3], state[:, 3:])
+
+
+@lru_cache(maxsize=8)
+def _read_orbit_state_vectors(orbit_file: str, mtime: float) -> OrbitStateVectors:
+    """Parse the orbit state vectors of a single orbit file.
+
+    Cached on the file name and modification time, so loading all subswaths
+    (and polarizations) of a product parses the orbit file only once.
+    """
+    orbit_tree = ET.parse(orbit_file)
+    return parse_osv_list(orbit_tree.find("Data_Block/List_of_OSVs"))
+
+
+def get_orbit_state_vectors(
+    orbit_file: str | list,
+    swath_start: datetime.datetime,
+    swath_stop: datetime.datetime,
+) -> OrbitStateVectors:
+    """Get the parsed orbit state vectors from the orbit file(s) `orbit_file`.
+
+    A single orbit file is parsed once and cached; a list of orbit files is
+    merged with `get_osv_list_from_orbit` and parsed on every call.
+
+    Parameters
+    ----------
+    orbit_file: str | list
+        Orbit file name, or list of the orbit file names
+    swath_start: datetime.datetime
+        Sensing start time of the swath
+    swath_stop: datetime.datetime
+        Sensing stop time of the swath
+
+    Returns
+    -------
+    _ : OrbitStateVectors
+        Times, positions and velocities of the orbit state vectors.
+    """
+    if isinstance(orbit_file, list) and len(orbit_file) == 1:
+        orbit_file = orbit_file[0]
+    if isinstance(orbit_file, str):
+        return _read_orbit_state_vectors(orbit_file, os.path.getmtime(orbit_file))
+
+    orbit_state_vector_list = get_osv_list_from_orbit(
+        orbit_file, swath_start, swath_stop
+    )
+    return parse_osv_list(orbit_state_vector_list)
+
+
+def get_burst_orbit(
+    sensing_start, sensing_stop, osv_list: ET.Element | OrbitStateVectors
+):
     """Init and return ISCE3 orbit.
 
     Parameters:
@@ -177,29 +259,31 @@ def get_burst_orbit(sensing_start, sensing_stop, osv_list: ET.Element):
         Sensing start of burst; taken from azimuth time
     sensing_stop : datetime.datetime
         Sensing stop of burst
-    osv_list : xml.etree.ElementTree.Element
-        ElementTree containing orbit state vectors
+    osv_list : xml.etree.ElementTree.Element or OrbitStateVectors
+        ElementTree containing orbit state vectors, or the output of
+        `parse_osv_list` (to avoid re-parsing the XML for every burst)
 
     Returns:
     --------
     _ : datetime
         Sensing mid as datetime object.
     """
-    orbit_sv = []
+    if not isinstance(osv_list, OrbitStateVectors):
+        osv_list = parse_osv_list(osv_list)
+
     # add start & end padding to ensure sufficient number of orbit points
     pad = datetime.timedelta(seconds=PADDING_SHORT)
-    for osv in osv_list:
-        t_orbit = as_datetime(osv[1].text[4:])
-
-        if t_orbit > sensing_stop + pad:
-            break
-
-        if t_orbit > sensing_start - pad:
-            pos = [float(osv[i].text) for i in range(4, 7)]
-            vel = [float(osv[i].text) for i in range(7, 10)]
-            orbit_sv.append(
-                isce3.core.StateVector(isce3.core.DateTime(t_orbit), pos, vel)
-            )
+    # the OSVs are sorted in time, so the padded burst is one contiguous slice
+    i_start = bisect.bisect_right(osv_list.times, sensing_start - pad)
+    i_stop = bisect.bisect_right(osv_list.times, sensing_stop + pad)
+    orbit_sv = [
+        isce3.core.StateVector(isce3.core.DateTime(t_orbit), pos.tolist(), vel.tolist())
+        for t_orbit, pos, vel in zip(
+            osv_list.times[i_start:i_stop],
+            osv_list.position[i_start:i_stop],
+            osv_list.velocity[i_start:i_stop],
+        )
+    ]
 
     # use list of stateVectors to init and return isce3.core.Orbit
     time_delta = datetime.timedelta(days=2)
@@ -225,14 +309,11 @@ def calculate_centroid(lons, lats):
     """
     proj = isce3.core.Geocent()
 
-    # convert boundary points to geocentric
-    xyz = [
-        proj.forward([np.deg2rad(lon), np.deg2rad(lat), 0])
-        for lon, lat in zip(lons, lats)
-    ]
+    # convert all boundary points to geocentric at once
+    xyz = llh_to_ecef(lats, lons, 0.0, proj.ellipsoid)
 
     # get mean of corners as centroid
-    xyz_centroid = np.mean(np.array(xyz), axis=0)
+    xyz_centroid = np.mean(xyz, axis=1)
 
     # convert back to LLH
     llh_centroid = [np.rad2deg(x) for x in proj.inverse(xyz_centroid)]
@@ -281,6 +362,7 @@ def get_burst_centers_and_boundaries(tree, num_bursts=None):
     n_bursts = len(unique_line_indices) - 1
     center_pts = [[]] * n_bursts
     boundary_pts = [[]] * n_bursts
+    burst_coords = [[]] * n_bursts
 
     # zip lines numbers of bursts together and iterate
     for i, (ln0, ln1) in enumerate(
@@ -296,9 +378,15 @@ def get_burst_centers_and_boundaries(tree, num_bursts=None):
         burst_lats = np.concatenate((lats[mask0], lats[mask1][::-1]))
 
         center_pts[i] = calculate_centroid(burst_lons, burst_lats)
+        burst_coords[i] = np.column_stack((burst_lons, burst_lats))
 
-        poly = shapely.geometry.Polygon(zip(burst_lons, burst_lats))
-        boundary_pts[i] = check_dateline(poly)
+    # build all the burst polygons in one call from the stacked coordinates
+    if n_bursts > 0:
+        ring_indices = np.repeat(
+            np.arange(n_bursts), [len(coords) for coords in burst_coords]
+        )
+        rings = shapely.linearrings(np.concatenate(burst_coords), indices=ring_indices)
+        boundary_pts = [check_dateline(poly) for poly in shapely.polygons(rings)]
 
     num_border_polygon = len(unique_line_indices) - 1
     if num_bursts > num_border_polygon:
@@ -590,7 +678,7 @@ def get_track_burst_num(track_burst_num_file: str = esa_track_burst_id_file):
 
 
 def get_ascending_node_time_orbit(
-    orbit_state_vector_list: ET,
+    orbit_state_vector_list: ET.Element | OrbitStateVectors,
     sensing_time: datetime.datetime,
     anx_time_annotation: datetime.datetime = None,
     search_length=None,
@@ -600,10 +688,11 @@ def get_ascending_node_time_orbit(
 
     Parameters
     ----------
-    orbit_state_vector_list: ET
+    orbit_state_vector_list: ET or OrbitStateVectors
         XML elements that points to the list of orbit information.
         Each element should contain the information below:
         TAI, UTC, UT1, Absolute_Orbit, X, Y, Z, VX, VY, VZ, and Quality
+        Alternatively, the output of `parse_osv_list`.
 
     sensing_time: datetime.datetime
         Sensing time of the data
@@ -628,13 +717,17 @@ def get_ascending_node_time_orbit(
         search_length = datetime.timedelta(seconds=2 * T_ORBIT)
 
     # Load the OSVs
-    utc_vec_all = [
-        datetime.datetime.fromisoformat(osv.find("UTC").text.replace("UTC=", ""))
-        for osv in orbit_state_vector_list
-    ]
-    utc_vec_all = np.array(utc_vec_all)
-    pos_z_vec_all = [float(osv.find("Z").text) for osv in orbit_state_vector_list]
-    pos_z_vec_all = np.array(pos_z_vec_all)
+    if isinstance(orbit_state_vector_list, OrbitStateVectors):
+        utc_vec_all = np.array(orbit_state_vector_list.times)
+        pos_z_vec_all = orbit_state_vector_list.position[:, 2]
+    else:
+        utc_vec_all = [
+            datetime.datetime.fromisoformat(osv.find("UTC").text.replace("UTC=", ""))
+            for osv in orbit_state_vector_list
+        ]
+        utc_vec_all = np.array(utc_vec_all)
+        pos_z_vec_all = [float(osv.find("Z").text) for osv in orbit_state_vector_list]
+        pos_z_vec_all = np.array(pos_z_vec_all)
 
     # NOTE: tried to apply the same amount of pading in `get_burst_orbit` to
     # get as similar results as possible.
@@ -780,6 +873,7 @@ def burst_from_xml(
     iw2_annotation_path: str,
     open_method=open,
     flag_apply_eap: bool = True,
+    burst_ids: list[Union[str, S1BurstId]] = None,
 ):
     """Parse bursts in Sentinel-1 annotation XML.
 
@@ -798,6 +892,10 @@ def burst_from_xml(
         Function used to open annotation file.
     flag_apply_eqp: bool
         Flag to turn on/off EAP related functionality
+    burst_ids : list[str] or list[S1BurstId]
+        List of burst IDs to parse. Bursts with other IDs are skipped before
+        any of their orbit, Doppler, or correction metadata is built.
+        Default of None parses all bursts.
 
     Returns:
     --------
@@ -983,7 +1081,7 @@ def burst_from_xml(
 
     # find orbit state vectors in 'Data_Block/List_of_OSVs'
     if orbit_path:
-        orbit_state_vector_list = get_osv_list_from_orbit(
+        orbit_state_vectors = get_orbit_state_vectors(
             orbit_path, first_line_utc_time, last_line_utc_time
         )
 
@@ -991,7 +1089,7 @@ def burst_from_xml(
         # compare with the info from annotation
         try:
             ascending_node_time_orbit = get_ascending_node_time_orbit(
-                orbit_state_vector_list,
+                orbit_state_vectors,
                 first_line_utc_time,
                 ascending_node_time_annotation,
             )
@@ -1027,13 +1125,21 @@ def burst_from_xml(
             "Using the ascending node time from annotation."
         )
         ascending_node_time = ascending_node_time_annotation
-        orbit_state_vector_list = []
+        orbit_state_vectors = None
 
     # load individual burst
     half_burst_in_seconds = 0.5 * (n_lines - 1) * azimuth_time_interval
     burst_list_elements = tree.find("swathTiming/burstList")
     n_bursts = int(burst_list_elements.attrib["count"])
-    bursts = [[]] * n_bursts
+    bursts = []
+    if isinstance(burst_ids, (str, S1BurstId)):
+        burst_ids = [burst_ids]
+    # match on the ID strings, so `str` and `S1BurstId` inputs behave the same
+    if burst_ids:
+        burst_ids = set(str(b) for b in burst_ids)
+    # number of burst IDs requested in this subswath, to stop once all are found
+    # (`burst_ids` may list the bursts of every subswath in a frame)
+    n_burst_ids = len([b for b in burst_ids or [] if b.endswith(subswath.lower())])
 
     center_pts, boundary_pts = get_burst_centers_and_boundaries(
         tree, num_bursts=n_bursts
@@ -1052,6 +1158,8 @@ def burst_from_xml(
         burst_id = S1BurstId.from_burst_params(
             sensing_time, ascending_node_time, start_track, end_track, subswath
         )
+        if burst_ids and str(burst_id) not in burst_ids:
+            continue
 
         # choose nearest azimuth FM rate
         az_fm_rate = get_nearest_polynomial(azimuth_time_mid, az_fm_rate_list)
@@ -1068,11 +1176,11 @@ def burst_from_xml(
         doppler = Doppler(poly1d, lut2d)
 
         sensing_duration = datetime.timedelta(seconds=n_lines * azimuth_time_interval)
-        if len(orbit_state_vector_list) > 0:
-            # get orbit from state vector list/element tree
+        if orbit_state_vectors is not None and len(orbit_state_vectors.times) > 0:
+            # get orbit from the parsed state vectors
 
             orbit = get_burst_orbit(
-                sensing_start, sensing_start + sensing_duration, orbit_state_vector_list
+                sensing_start, sensing_start + sensing_duration, orbit_state_vectors
             )
         else:
             orbit = None
@@ -1140,50 +1248,54 @@ def burst_from_xml(
         # Miscellaneous burst metadata
         burst_misc_metadata = swath_misc_metadata.extract_by_aztime(sensing_start)
 
-        bursts[i] = Sentinel1BurstSlc(
-            ipf_version,
-            sensing_start,
-            radar_freq,
-            wavelength,
-            azimuth_steer_rate,
-            average_azimuth_pixel_spacing,
-            azimuth_time_interval,
-            slant_range_time,
-            starting_range,
-            iw2_mid_range,
-            range_sampling_rate,
-            range_pxl_spacing,
-            (n_lines, n_samples),
-            az_fm_rate,
-            doppler,
-            rng_processing_bandwidth,
-            pol,
-            burst_id,
-            platform_id,
-            safe_filename,
-            center_pts[i],
-            boundary_pts[i],
-            orbit,
-            orbit_direction,
-            orbit_number,
-            tiff_path,
-            i,
-            first_valid_sample,
-            last_sample,
-            first_valid_line,
-            last_line,
-            range_window_type,
-            range_window_coeff,
-            rank,
-            prf_raw_data,
-            range_chirp_ramp_rate,
-            burst_calibration,
-            burst_noise,
-            burst_aux_cal,
-            extended_coeffs,
-            burst_rfi_info,
-            burst_misc_metadata,
+        bursts.append(
+            Sentinel1BurstSlc(
+                ipf_version,
+                sensing_start,
+                radar_freq,
+                wavelength,
+                azimuth_steer_rate,
+                average_azimuth_pixel_spacing,
+                azimuth_time_interval,
+                slant_range_time,
+                starting_range,
+                iw2_mid_range,
+                range_sampling_rate,
+                range_pxl_spacing,
+                (n_lines, n_samples),
+                az_fm_rate,
+                doppler,
+                rng_processing_bandwidth,
+                pol,
+                burst_id,
+                platform_id,
+                safe_filename,
+                center_pts[i],
+                boundary_pts[i],
+                orbit,
+                orbit_direction,
+                orbit_number,
+                tiff_path,
+                i,
+                first_valid_sample,
+                last_sample,
+                first_valid_line,
+                last_line,
+                range_window_type,
+                range_window_coeff,
+                rank,
+                prf_raw_data,
+                range_chirp_ramp_rate,
+                burst_calibration,
+                burst_noise,
+                burst_aux_cal,
+                extended_coeffs,
+                burst_rfi_info,
+                burst_misc_metadata,
+            )
         )
+        if n_burst_ids and len(bursts) == n_burst_ids:
+            break
 
     return bursts
 
@@ -1265,9 +1377,11 @@ def load_bursts(
     if not os.path.exists(path):
         raise FileNotFoundError(f"{path} not found")
     elif os.path.isdir(path):
-        bursts = _burst_from_safe_dir(path, id_str, orbit_path, flag_apply_eap)
+        bursts = _burst_from_safe_dir(
+            path, id_str, orbit_path, flag_apply_eap, burst_ids
+        )
     elif os.path.isfile(path):
-        bursts = _burst_from_zip(path, id_str, orbit_path, flag_apply_eap)
+        bursts = _burst_from_zip(path, id_str, orbit_path, flag_apply_eap, burst_ids)
     else:
         raise ValueError(f"{path} is unsupported")
 
@@ -1291,7 +1405,13 @@ def load_bursts(
     return bursts
 
 
-def _burst_from_zip(zip_path: str, id_str: str, orbit_path: str, flag_apply_eap: bool):
+def _burst_from_zip(
+    zip_path: str,
+    id_str: str,
+    orbit_path: str,
+    flag_apply_eap: bool,
+    burst_ids: list[Union[str, S1BurstId]] = None,
+):
     """Find bursts in a Sentinel-1 zip file.
 
     Parameters:
@@ -1304,6 +1424,8 @@ def _burst_from_zip(zip_path: str, id_str: str, orbit_path: str, flag_apply_eap:
         Path the orbit file.
     flag_apply_eap: bool
         Turn on/off EAP related features (AUX_CAL loader)
+    burst_ids : list[str] or list[S1BurstId]
+        List of burst IDs to parse. Default of None parses all bursts.
 
     Returns:
     --------
@@ -1341,12 +1463,17 @@ def _burst_from_zip(zip_path: str, id_str: str, orbit_path: str, flag_apply_eap:
             iw2_f_annotation,
             z_file.open,
             flag_apply_eap=flag_apply_eap,
+            burst_ids=burst_ids,
         )
         return bursts
 
 
 def _burst_from_safe_dir(
-    safe_dir_path: str, id_str: str, orbit_path: str, flag_apply_eap: bool
+    safe_dir_path: str,
+    id_str: str,
+    orbit_path: str,
+    flag_apply_eap: bool,
+    burst_ids: list[Union[str, S1BurstId]] = None,
 ):
     """Find bursts in a Sentinel-1 SAFE structured directory.
 
@@ -1360,6 +1487,8 @@ def _burst_from_safe_dir(
         Path the orbit file.
     flag_apply_eap: bool
         Turn on/off EAP related features (AUX_CAL loader)
+    burst_ids : list[str] or list[S1BurstId]
+        List of burst IDs to parse. Default of None parses all bursts.
 
     Returns:
     --------
@@ -1397,5 +1526,6 @@ def _burst_from_safe_dir(
         f_tiff,
         iw2_f_annotation,
         flag_apply_eap=flag_apply_eap,
+        burst_ids=burst_ids,
     )
     return bursts
@@ -9,6 +9,7 @@ except ImportError:
     print("ERROR: fiona, geopandas, and pandas are required for this script.")
     raise
 
+import numpy as np
 from osgeo import osr
 from shapely.geometry import Polygon
 from shapely import wkt
@@ -95,6 +96,14 @@ def burst_map(slc, orbit_dir, x_spacing, y_spacing, epsg, output_filename):
     pol = "vv"
     orbit_path = get_orbit_file_from_dir(slc, orbit_dir) if orbit_dir else None
 
+    # The same lat/long -> EPSG transformation is used for every burst
+    llh = osr.SpatialReference()
+    llh.ImportFromEPSG(4326)
+    tgt = osr.SpatialReference()
+    tgt.ImportFromEPSG(int(epsg))
+    trans = osr.CoordinateTransformation(llh, tgt)
+    spacing = (x_spacing, y_spacing, x_spacing, y_spacing)
+
     for subswath in i_subswath:
         ref_bursts = load_bursts(slc, orbit_path, subswath, pol)
         for burst in ref_bursts:
@@ -116,31 +125,21 @@ def burst_map(slc, orbit_dir, x_spacing, y_spacing, epsg, output_filename):
             poly = poly.buffer(margin)
             burst_map["border"].append(Polygon(poly.exterior.coords).wkt)
 
-            # Transform coordinates from lat/long to EPSG
-            llh = osr.SpatialReference()
-            llh.ImportFromEPSG(4326)
-            tgt = osr.SpatialReference()
-
-            tgt_x, tgt_y = [], []
+            # Transform coordinates from lat/long to EPSG in one call
             x, y = poly.exterior.coords.xy
-            tgt.ImportFromEPSG(int(epsg))
-            trans = osr.CoordinateTransformation(llh, tgt)
-            for lx, ly in zip(x, y):
-                dummy_y, dummy_x, dummy_z = trans.TransformPoint(ly, lx, 0)
-                tgt_x.append(dummy_x)
-                tgt_y.append(dummy_y)
+            tgt_points = np.array(trans.TransformPoints(list(zip(y, x))))
+            tgt_y, tgt_x = tgt_points[:, 0], tgt_points[:, 1]
 
             # TODO: Get the min/max from the burst database
-            if epsg == 4326:
-                x_min = x_spacing * (min(tgt_x) / x_spacing)
-                y_min = y_spacing * (min(tgt_y) / y_spacing)
-                x_max = x_spacing * (max(tgt_x) / x_spacing)
-                y_max = y_spacing * (max(tgt_y) / y_spacing)
-            else:
-                x_min = x_spacing * round(min(tgt_x) / x_spacing)
-                y_min = y_spacing * round(min(tgt_y) / y_spacing)
-                x_max = x_spacing * round(max(tgt_x) / x_spacing)
-                y_max = y_spacing * round(max(tgt_y) / y_spacing)
+            bounds = np.array([tgt_x.min(), tgt_y.min(), tgt_x.max(), tgt_y.max()])
+            n_spacings = bounds / spacing
+            if epsg != 4326:
+                # Snap the bounds to the geogrid spacing
+                n_spacings = np.rint(n_spacings).astype(int)
+            # Scale by the input spacings, so integer spacings give integer bounds
+            x_min, y_min, x_max, y_max = [
+                dx * n for dx, n in zip(spacing, n_spacings.tolist())
+            ]
 
             # Allocate coordinates inside the dictionary
             burst_map["min_x"].append(x_min)
@@ -3,6 +3,9 @@ from datetime import timedelta
 import isce3
 import numpy as np
 
+from s1reader.s1_burst_id import S1BurstId
+from s1reader.s1_reader import calculate_centroid, load_bursts
+
 
 def test_burst(bursts):
     last_valid_lines = [1487, 1489, 1489, 1490, 1487, 1488, 1488, 1489, 1488]
@@ -118,3 +121,62 @@ def test_as_isce3_radargrid_step_change(bursts):
     grid = burst.as_isce3_radargrid(az_step=az_step)
     assert grid.width == burst.width
     assert grid.length == burst.length // 2
+
+
+def test_calculate_centroid(bursts):
+    proj = isce3.core.Geocent()
+    for burst in bursts:
+        lons, lats = burst.border[0].exterior.coords.xy
+        xyz = [
+            proj.forward([np.deg2rad(lon), np.deg2rad(lat), 0])
+            for lon, lat in zip(lons, lats)
+        ]
+        expected = np.rad2deg(proj.inverse(np.mean(xyz, axis=0)))[:2]
+        centroid = calculate_centroid(np.array(lons), np.array(lats))
+        assert np.allclose([centroid.x, centroid.y], expected)
+
+
+def test_burst_id_eq():
+    burst_id = S1BurstId(71, 151204, "iw3")
+    assert burst_id == S1BurstId(71, 151204, "iw3")
+    assert burst_id == "t071_151204_iw3"
+    assert burst_id == S1BurstId.from_str("t071_151204_iw3")
+    assert burst_id != S1BurstId(71, 151205, "iw3")
+    assert burst_id != S1BurstId(71, 151204, "iw2")
+    assert burst_id in {S1BurstId(71, 151204, "iw3")}
+
+
+def test_load_bursts_burst_ids(test_paths, bursts):
+    orbit_path = f"{test_paths.orbit_dir}/{test_paths.orbit_file}"
+    wanted = [str(bursts[2].burst_id), bursts[5].burst_id]
+    filtered = load_bursts(test_paths.safe, orbit_path, 3, "vv", burst_ids=wanted)
+
+    assert [str(b.burst_id) for b in filtered] == [
+        str(bursts[2].burst_id),
+        str(bursts[5].burst_id),
+    ]
+    assert [b.i_burst for b in filtered] == [2, 5]
+    assert filtered[1].border == bursts[5].border
+
+
+def test_load_bursts_burst_ids_early_exit(test_paths, bursts, monkeypatch):
+    # Count the annotation bursts visited, which each get a burst ID computed
+    from_burst_params = S1BurstId.from_burst_params
+    visited = []
+
+    def counting_from_burst_params(*args, **kwargs):
+        visited.append(1)
+        return from_burst_params(*args, **kwargs)
+
+    monkeypatch.setattr(S1BurstId, "from_burst_params", counting_from_burst_params)
+
+    # A frame-wide list also holds IDs from the other subswaths, as either
+    # S1BurstId objects or strings
+    wanted_id = str(bursts[1].burst_id)
+    wanted = [bursts[1].burst_id, wanted_id.replace("iw3", "iw1")]
+    orbit_path = f"{test_paths.orbit_dir}/{test_paths.orbit_file}"
+    filtered = load_bursts(test_paths.safe, orbit_path, 3, "vv", burst_ids=wanted)
+
+    assert [str(b.burst_id) for b in filtered] == [wanted_id]
+    # Only bursts 0 and 1 are visited, out of the full subswath
+    assert len(visited) == 2 < len(bursts)
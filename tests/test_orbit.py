@@ -21,7 +21,14 @@ from s1reader.s1_orbit import (
     combine_xml_orbit_elements,
     list_public_bucket,
 )
-from s1reader.s1_reader import as_datetime, get_ascending_node_time_orbit
+from s1reader.s1_reader import (
+    OrbitStateVectors,
+    as_datetime,
+    get_ascending_node_time_orbit,
+    get_burst_orbit,
+    get_orbit_state_vectors,
+    parse_osv_list,
+)
 import s1reader.s1_orbit
 
 
@@ -119,6 +126,44 @@ def test_orbit_datetime(bursts):
         assert burst.border[0].contains(pnt)
 
 
+def test_get_burst_orbit_slice(test_paths):
+    """
+    The bisected slice of the parsed state vectors keeps exactly the state
+    vectors selected by walking the orbit XML.
+    """
+    orbit_path = f"{test_paths.orbit_dir}/{test_paths.orbit_file}"
+    osv_list = ET.parse(orbit_path).find("Data_Block/List_of_OSVs")
+    osvs = parse_osv_list(osv_list)
+    assert isinstance(osvs, OrbitStateVectors)
+    assert osvs.position.shape == osvs.velocity.shape == (len(osvs.times), 3)
+
+    pad = datetime.timedelta(seconds=60)
+    burst_duration = datetime.timedelta(seconds=3)
+    # start times before, inside (on and between OSV times), and near the end
+    for sensing_start in [
+        osvs.times[0] - burst_duration,
+        osvs.times[0],
+        osvs.times[10] + datetime.timedelta(seconds=3.2),
+        osvs.times[len(osvs.times) // 2],
+        osvs.times[-10],
+    ]:
+        sensing_stop = sensing_start + burst_duration
+        expected = []
+        for osv in osv_list:
+            t_orbit = as_datetime(osv[1].text[4:])
+            if t_orbit > sensing_stop + pad:
+                break
+            if t_orbit > sensing_start - pad:
+                expected.append([float(osv[i].text) for i in range(4, 10)])
+        expected = np.array(expected).reshape(-1, 6)
+
+        for osvs_in in [osv_list, osvs]:
+            orbit = get_burst_orbit(sensing_start, sensing_stop, osvs_in)
+            assert orbit.time.size == len(expected)
+            assert np.array_equal(orbit.position, expected[:, :3])
+            assert np.array_equal(orbit.velocity, expected[:, 3:])
+
+
 def test_anx_time(test_paths):
     """
     Compute ascending node crossing (ANX) time from orbit,
@@ -155,6 +200,28 @@ def test_anx_time(test_paths):
 
     assert abs(diff_ascending_node_time_seconds) < 0.5
 
+    # The parsed state vectors give the same ANX time as the XML elements
+    assert ascending_node_time_orbit == get_ascending_node_time_orbit(
+        parse_osv_list(orbit_state_vector_list),
+        first_line_utc_time,
+        ascending_node_time_annotation,
+    )
+
+
+def test_get_orbit_state_vectors_cached(test_paths):
+    orbit_path = f"{test_paths.orbit_dir}/{test_paths.orbit_file}"
+    osvs = get_orbit_state_vectors(orbit_path, None, None)
+    # A single orbit file is parsed once, and shared read-only between calls
+    assert get_orbit_state_vectors([orbit_path], None, None) is osvs
+    assert not osvs.position.flags.writeable
+    assert not osvs.velocity.flags.writeable
+
+    osv_list = ET.parse(orbit_path).find("Data_Block/List_of_OSVs")
+    expected = parse_osv_list(osv_list)
+    assert osvs.times == expected.times
+    assert np.array_equal(osvs.position, expected.position)
+    assert np.array_equal(osvs.velocity, expected.velocity)
+
 
 def test_combine_xml_orbit_elements(tmp_path, test_paths):
     slc_file = (
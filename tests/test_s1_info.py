@@ -0,0 +1,45 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+from shapely.geometry import MultiPolygon
+
+from s1reader.s1_info import get_burst_bounds, main
+
+data_path = Path(__file__).parent.resolve() / "data"
+
+
+def test_get_burst_bounds(bursts):
+    expected = [MultiPolygon(b.border).bounds for b in bursts]
+    assert np.allclose(get_burst_bounds(bursts), expected)
+
+
+def test_get_burst_bounds_empty():
+    assert get_burst_bounds([]).shape == (0, 4)
+
+
+def _run_s1_info(monkeypatch, capsys, argv):
+    monkeypatch.setattr(sys, "argv", ["s1_info", *argv])
+    main()
+    return capsys.readouterr().out
+
+
+def test_s1_info_jobs(monkeypatch, capsys):
+    # Listed out of sorted order, to check the output follows the input order
+    paths = [
+        str(
+            data_path
+            / "S1A_IW_SLC__1SDV_20230108T135249_20230108T135316_046693_0598D3_BA76.zip"
+        ),
+        str(
+            data_path
+            / "S1A_IW_SLC__1SDV_20200511T135117_20200511T135144_032518_03C421_7768.zip"
+        ),
+    ]
+    args = [*paths, "--burst-id", "--burst-bbox", "--iw", "2"]
+    serial = _run_s1_info(monkeypatch, capsys, args)
+    parallel = _run_s1_info(monkeypatch, capsys, [*args, "--jobs", "2"])
+
+    assert parallel == serial
+    headers = [line for line in serial.splitlines() if line.startswith("Bursts in")]
+    assert headers == [f"Bursts in {p}:" for p in paths]